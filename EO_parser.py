@@ -9,14 +9,20 @@ from playwright.async_api import async_playwright
 from playwright_stealth import Stealth
 import sqlite3
 import random
+import re
 import asyncio
-import datetime
+import calendar
+import html
+import httpx
 import signal
 import sys
+import threading
+from collections import OrderedDict
 from os import mkdir
 from pathlib import Path
-from bs4 import BeautifulSoup
-from PySide6.QtCore import Qt
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, QTimer, Signal
 from PySide6.QtGui import QPalette, QColor
 from PySide6.QtWidgets import (
     QApplication,
@@ -29,8 +35,7 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QLabel,
     QMessageBox,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QScrollArea,
     QDialog,
@@ -47,6 +52,14 @@ config = {
     # Scraper configuration
     "playwright_tmp_dir": "./tmp/playwright_profile",
 
+    "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+
+    # Number of EO pages fetched at the same time
+    "max_concurrent_requests": 20,
+
+    # Number of browser tabs used to scrape the listing pages at the same time
+    "listing_tabs": 5,
+
     # Debug mode enables the chromium browser window to be visible during scraping
     "debug_mode": False,
 
@@ -60,50 +73,132 @@ config = {
 
 ##*-*## Database classes & methods ##*-*##
 class Database:
+    # SQL is kept constant so sqlite3's statement cache can reuse the compiled statements
+    _INSERT_SQL = "INSERT INTO executive_orders(title, date, content, url) VALUES (?, ?, ?, ?)"  # id is left out so SQLite assigns the next rowid itself
+    _INSERT_OR_IGNORE_SQL = "INSERT OR IGNORE INTO executive_orders(title, date, content, url) VALUES (?, ?, ?, ?)"
+    _SEARCH_ID_SQL = "SELECT * FROM executive_orders WHERE id=?"
+    _SEARCH_TITLE_SQL = "SELECT * FROM executive_orders WHERE title=?"
+    _SEARCH_URL_SQL = "SELECT * FROM executive_orders WHERE url=?"
+    _FTS_CREATE_SQL = "CREATE VIRTUAL TABLE eo_fts USING fts5(title, content, date, url, content='executive_orders', content_rowid='id', tokenize='porter unicode61')"
+    # exact id/date matches come first, then full text matches by relevance
+    _FTS_SEARCH_SQL = """
+        SELECT id, title, date FROM (
+            SELECT id, title, date, 0 AS exact, 0.0 AS rank FROM executive_orders WHERE id = ? OR date = ?
+            UNION ALL
+            SELECT eo.id, eo.title, eo.date, 1, bm25(eo_fts) FROM eo_fts JOIN executive_orders eo ON eo.id = eo_fts.rowid WHERE eo_fts MATCH ?
+        ) GROUP BY id ORDER BY MIN(exact), MIN(rank)
+    """
+    _LIKE_SEARCH_SQL = ("SELECT id, title, date FROM executive_orders WHERE CAST(id AS TEXT) LIKE ? ESCAPE '\\' OR title LIKE ? ESCAPE '\\' "
+                        "OR date LIKE ? ESCAPE '\\' OR content LIKE ? ESCAPE '\\' OR url LIKE ? ESCAPE '\\'")
+
     def __init__(self):
         """Initializes the SQLite database and creates the executive_orders table"""
         self.db_dir = config["database_dir"]
-        self.raw_eo_data = None
-        self.added_eos = 0
         Path(self.db_dir).mkdir(parents=True, exist_ok=True)
         self.db_path = f"{self.db_dir}{config['database_file']}"
-        self.con = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.con = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+        self.con.row_factory = sqlite3.Row  # rows can be accessed by column name as well as index
+        self.con.execute("PRAGMA journal_mode=WAL")
+        self.con.execute("PRAGMA synchronous=NORMAL")
+        self.con.execute("PRAGMA temp_store=MEMORY")
+        self.con.execute("PRAGMA mmap_size=268435456")  # 256MB
+        self.con.execute("PRAGMA cache_size=-20000")  # ~20MB
         try:
-            self.con.execute("CREATE TABLE executive_orders(id INTEGER PRIMARY KEY, title TEXT, date TEXT, content TEXT, url TEXT)")
+            self.con.execute("CREATE TABLE executive_orders(id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT, date TEXT, content TEXT, url TEXT)")
         except sqlite3.OperationalError:
             pass  # Table already exists
+        self.con.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_eo_url ON executive_orders(url)")  # lets INSERT OR IGNORE skip duplicate urls
+        try:
+            self.con.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_eo_title_unique ON executive_orders(title)")  # backstop for the title dedup below
+            self.con.execute("DROP INDEX IF EXISTS idx_eo_title")  # made redundant by the unique index
+        except sqlite3.IntegrityError:
+            self.con.execute("CREATE INDEX IF NOT EXISTS idx_eo_title ON executive_orders(title)")  # older databases may hold duplicate titles
+        self.con.execute("CREATE INDEX IF NOT EXISTS idx_eo_date ON executive_orders(date)")
+        self._titles = {row["title"] for row in self.con.execute("SELECT title FROM executive_orders")} # stored titles, for dedup without a query
+        self.fts_enabled = self.create_fts_index()
+
+    def create_fts_index(self):
+        """Creates the full text search index and the triggers keeping it in sync, returns False if FTS5 is unavailable"""
+        try:
+            existing = self.con.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name='eo_fts'").fetchone()
+            if existing is None or existing["sql"] != self._FTS_CREATE_SQL:
+                # missing or built with an older definition, (re)create it from scratch
+                for trigger in ("eo_fts_insert", "eo_fts_delete", "eo_fts_update"):
+                    self.con.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+                self.con.execute("DROP TABLE IF EXISTS eo_fts")
+                self.con.execute(self._FTS_CREATE_SQL)
+                self.con.execute("INSERT INTO eo_fts(eo_fts) VALUES('rebuild')")  # index any pre-existing entries
+            self.con.execute("""
+                CREATE TRIGGER IF NOT EXISTS eo_fts_insert AFTER INSERT ON executive_orders BEGIN
+                    INSERT INTO eo_fts(rowid, title, content, date, url) VALUES (new.id, new.title, new.content, new.date, new.url);
+                END
+            """)
+            self.con.execute("""
+                CREATE TRIGGER IF NOT EXISTS eo_fts_delete AFTER DELETE ON executive_orders BEGIN
+                    INSERT INTO eo_fts(eo_fts, rowid, title, content, date, url) VALUES ('delete', old.id, old.title, old.content, old.date, old.url);
+                END
+            """)
+            self.con.execute("""
+                CREATE TRIGGER IF NOT EXISTS eo_fts_update AFTER UPDATE ON executive_orders BEGIN
+                    INSERT INTO eo_fts(eo_fts, rowid, title, content, date, url) VALUES ('delete', old.id, old.title, old.content, old.date, old.url);
+                    INSERT INTO eo_fts(rowid, title, content, date, url) VALUES (new.id, new.title, new.content, new.date, new.url);
+                END
+            """)
+            self.con.commit()
+            return True
+        except sqlite3.OperationalError as e:
+            print("Full text search is unavailable, falling back to LIKE searches: ", e)
+            self.con.rollback()
+            return False
 
     def store_eo(self, eo_data):
-        """Used for storing data within the database"""
-        if self.search_by_title(eo_data["title"]) or self.search_by_url(eo_data["url"]) or self.check_exists(eo_data["url"]):
+        """Used for storing data within the database, returns whether the entry was added"""
+        if eo_data["title"] in self._titles or self.check_exists(eo_data["url"]):
             print(f"EO titled '{eo_data['title']}' already exists in the database. Skipping entry.")
-            return  # Skip adding duplicate entry based on title
+            return False  # Skip adding duplicate entry based on title
 
-        cursor = self.con.execute("SELECT MAX(id) FROM executive_orders")
-        max_id = cursor.fetchone()[0]
-        eo_id = (max_id + 1) if max_id is not None else 1
         title = eo_data["title"]
         date = eo_data["date"]
         content = eo_data["content"]
         url = eo_data["url"]
 
-        self.con.execute("""
-            INSERT INTO executive_orders VALUES
-                        (?, ?, ?, ?, ?)
-        """, (eo_id, title, date, content, url))
+        self.con.execute(self._INSERT_SQL, (title, date, content, url))
 
-        self.added_eos += 1
+        self._titles.add(title)
         self.con.commit() # commit the new entry to the database
+        return True
+
+    def store_many(self, eos):
+        """Stores a batch of executive orders within a single transaction, skipping duplicate titles and urls. Returns the number of added entries"""
+        new_titles = set()
+        self.con.execute("PRAGMA synchronous=OFF")  # skip syncs for the bulk load, can't be changed inside the transaction
+        try:
+            with self.con:
+                for eo in eos:
+                    if eo["title"] in self._titles or eo["title"] in new_titles:
+                        continue  # same title dedup as store_eo, urls are handled by INSERT OR IGNORE
+                    cursor = self.con.execute(self._INSERT_OR_IGNORE_SQL, (eo["title"], eo["date"], eo["content"], eo["url"]))
+                    if cursor.rowcount == 1:  # rows ignored for a duplicate url don't claim their title
+                        new_titles.add(eo["title"])
+        finally:
+            self.con.execute("PRAGMA synchronous=NORMAL")
+        self._titles |= new_titles
+        return len(new_titles)
+
+    def analyze(self):
+        """Refreshes the query planner statistics, meant to run once after a bulk load"""
+        self.con.execute("ANALYZE")
+        self.con.commit()
 
     def full_database(self):
-        """Prints out the stored executive orders"""
+        """Returns all stored executive orders"""
         cursor = self.con.execute("SELECT * FROM executive_orders")
         rows = cursor.fetchall()
         return rows
 
     def search_by_id(self, eo_id):
         """Searches the SQLite database for an entry matching the given id"""
-        cursor = self.con.execute(f"SELECT * FROM executive_orders WHERE id=?", (eo_id,))
+        cursor = self.con.execute(self._SEARCH_ID_SQL, (eo_id,))
         result = cursor.fetchone()
         if result:
             return result
@@ -111,7 +206,7 @@ class Database:
     
     def search_by_title(self, title):
         """Searches the SQLite database for an entry matching the given title"""
-        cursor = self.con.execute(f"SELECT * FROM executive_orders WHERE title=?", (title,))
+        cursor = self.con.execute(self._SEARCH_TITLE_SQL, (title,))
         result = cursor.fetchone()
         if result:
             return result
@@ -119,33 +214,61 @@ class Database:
     
     def search_by_url(self, url):
         """Searches the SQLite database for an entry matching the given url"""
-        cursor = self.con.execute(f"SELECT * FROM executive_orders WHERE url=?", (url,))
+        cursor = self.con.execute(self._SEARCH_URL_SQL, (url,))
         result = cursor.fetchone()
         if result:
             return result
         return None
     
-    def get_raw_data_from_title(self, title):
-        """Retrieves the raw executive order data based on the given title"""
-        for entry in self.raw_eo_data:
-            if entry["title"] == title:
-                return entry
-        return None
-    
+    def count(self):
+        """Returns the number of stored executive orders"""
+        return self.con.execute("SELECT COUNT(*) FROM executive_orders").fetchone()[0]
+
+    def page(self, limit, offset, order_by="id", descending=False):
+        """Returns a slice of (id, title, date) rows, ordered by the given column"""
+        if order_by not in ("id", "title", "date"):
+            raise ValueError(f"Can't order executive orders by '{order_by}'")
+        direction = "DESC" if descending else "ASC"
+        cursor = self.con.execute(f"SELECT id, title, date FROM executive_orders ORDER BY {order_by} {direction}, id LIMIT ? OFFSET ?",
+                                  (limit, offset))
+        return cursor.fetchall()
+
+    def search(self, criteria, con=None):
+        """Searches all columns for the given criteria, returning (id, title, date) rows. Accepts a separate connection for use from other threads"""
+        con = con or self.con
+        criteria = criteria.strip()
+        fts_query = self.fts_query(criteria)
+        if self.fts_enabled and len(criteria) >= 3 and fts_query:  # very short strings make poor full text queries
+            try:
+                rows = con.execute(self._FTS_SEARCH_SQL, (criteria, criteria, fts_query)).fetchall()
+                if rows:
+                    return rows
+                # no word matches, e.g. text from the middle of a word, so the substring search below still gets a go
+            except sqlite3.OperationalError:
+                pass  # FTS query failed, use LIKE instead
+
+        escaped = criteria.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")  # match % and _ literally
+        like = f"%{escaped}%"
+        cursor = con.execute(self._LIKE_SEARCH_SQL, (like, like, like, like, like))
+        return cursor.fetchall()
+
+    def fts_query(self, criteria):
+        """Turns free text into an FTS5 query matching every word, the last one as a prefix since it may still be being typed"""
+        words = re.findall(r"\w+", criteria)
+        if not words:
+            return None
+        terms = [f'"{word}"' for word in words]  # quoted so words like AND/OR/NEAR aren't read as operators
+        terms[-1] += "*"
+        return " ".join(terms)
+
     def get_formatted_data_from_id(self, eo_id):
-        """Retrieves the formatted executive order data based on the given id"""
-        cursor = self.con.execute(f"SELECT * FROM executive_orders WHERE id=?", (eo_id,))
-        result = cursor.fetchone()
-        if result:
-            eo_data = {
-                "id": result[0],
-                "title": result[1],
-                "date": result[2],
-                "content": result[3],
-                "url": result[4]
-            }
-            return eo_data
-        return None
+        """Retrieves the formatted executive order data based on the given id, as a row accessible by column name"""
+        cursor = self.con.execute(self._SEARCH_ID_SQL, (eo_id,))
+        return cursor.fetchone()
+
+    def known_urls(self):
+        """Returns the set of all stored executive order urls"""
+        return {row["url"] for row in self.con.execute("SELECT url FROM executive_orders")}
 
     def check_exists(self, url):
         """Checks if an entry exists within the database based on the given url"""
@@ -167,11 +290,139 @@ class NoElidingDelegate(QStyledItemDelegate):
         super().paint(painter, option, index)
 
 
+class ExecutiveOrderModel(QAbstractTableModel):
+    """Table model that loads database rows in blocks as they're displayed, or holds a list of search results"""
+    COLUMNS = ["id", "title", "date"]
+    HEADERS = ["ID", "Title", "Date"]
+    BLOCK_SIZE = 100
+    MAX_BLOCKS = 20 # blocks kept in the LRU cache
+
+    def __init__(self, database, parent=None):
+        super().__init__(parent)
+        self.database = database
+        self._results = None # search results, None while the full database is shown
+        self._row_count = 0
+        self._blocks = OrderedDict() # block index -> rows, least recently used first
+        self._sort_column = 0
+        self._sort_descending = False
+
+    def refresh(self):
+        """Shows the full database, dropping any cached rows"""
+        self.beginResetModel()
+        self._results = None
+        self._blocks.clear()
+        self._row_count = self.database.count()
+        self.endResetModel()
+
+    def append_new_rows(self):
+        """Picks up newly stored rows as a single insert, only resetting the view when they may not land at the end"""
+        if self._results is not None:
+            return  # search results stay as they are
+        if self._sort_column != 0 or self._sort_descending:
+            self.refresh()
+            return
+
+        new_count = self.database.count()
+        if new_count < self._row_count:
+            self.refresh()
+        elif new_count > self._row_count:
+            self._blocks.pop(self._row_count // self.BLOCK_SIZE, None)  # the last loaded block may be partial
+            self.beginInsertRows(QModelIndex(), self._row_count, new_count - 1)
+            self._row_count = new_count
+            self.endInsertRows()
+
+    def set_results(self, rows):
+        """Shows the given search result rows, keeping their relevance order until a column is sorted"""
+        self.beginResetModel()
+        self._results = list(rows)
+        self.endResetModel()
+
+    def row_at(self, row_idx):
+        """Returns the (id, title, date) row displayed at the given position"""
+        if self._results is not None:
+            return self._results[row_idx]
+
+        block_idx = row_idx // self.BLOCK_SIZE
+        block = self._blocks.get(block_idx)
+        if block is None:
+            block = self.database.page(self.BLOCK_SIZE, block_idx * self.BLOCK_SIZE,
+                                       self.COLUMNS[self._sort_column], self._sort_descending)
+            self._blocks[block_idx] = block
+            if len(self._blocks) > self.MAX_BLOCKS:
+                self._blocks.popitem(last=False)
+        else:
+            self._blocks.move_to_end(block_idx)
+
+        offset = row_idx % self.BLOCK_SIZE
+        return block[offset] if offset < len(block) else None
+
+    def entry_id(self, row_idx):
+        """Returns the id of the executive order displayed at the given position"""
+        row = self.row_at(row_idx)
+        return row["id"] if row is not None else None
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._results) if self._results is not None else self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        row = self.row_at(index.row())
+        if row is None:
+            return None
+        return str(row[index.column()]).strip()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sorts through SQL for the full database, or in memory for search results"""
+        self.beginResetModel()
+        self._sort_column = column
+        self._sort_descending = order == Qt.DescendingOrder
+        self._blocks.clear()
+        if self._results is not None:
+            self._sort_results()
+        self.endResetModel()
+
+    def _sort_results(self):
+        self._results.sort(key=lambda row: row[self._sort_column], reverse=self._sort_descending)
+
+
+class ScraperSignals(QObject):
+    """Signals used by the background scraper thread to report back to the GUI thread"""
+    batchStored = Signal()
+    finished = Signal(int) # number of added EOs
+    failed = Signal(str)
+
+
 class Viewer(QMainWindow):
     def __init__(self, database):
         super().__init__()
         self.database = database
-        self.scraper = None
+        self.scraper_thread = None
+        self.scraper_signals = ScraperSignals()
+        self.scraper_signals.batchStored.connect(self.on_scraper_batch_stored)
+        self.scraper_signals.finished.connect(self.on_scraper_finished)
+        self.scraper_signals.failed.connect(self.on_scraper_failed)
+        self._search_seq = 0 # incremented per search so stale worker results can be dropped
+        self.search_signals = SearchSignals()
+        self.search_signals.resultsReady.connect(self.show_search_results)
+        self.search_signals.failed.connect(self.on_search_failed)
+
+        # coalesces row sizing requests from scrolling, resizing and model changes into a single pass
+        self.row_resize_timer = QTimer(self)
+        self.row_resize_timer.setSingleShot(True)
+        self.row_resize_timer.setInterval(0)
+        self.row_resize_timer.timeout.connect(self.resize_visible_rows)
+
         self.setWindowTitle("Executive Orders Database Viewer")
         self.setGeometry(100, 100, 800, 600)
 
@@ -189,6 +440,13 @@ class Viewer(QMainWindow):
         self.search_button.clicked.connect(self.perform_search)
         self.search_input.returnPressed.connect(self.perform_search)
 
+        # search while typing, once the input has been idle for a moment
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self.perform_search)
+        self.search_input.textChanged.connect(lambda _: self.search_timer.start())
+
         self.clear_button = QPushButton("Clear search results")
         self.clear_button.clicked.connect(self.clear_results)
 
@@ -202,69 +460,100 @@ class Viewer(QMainWindow):
         self.foundation_layout.addLayout(self.top_bar)
 
         # table for displaying results
-        self.results_table = QTableWidget() # table with brief results listed, clicking on a row shows full EO details below
+        self.results_model = ExecutiveOrderModel(self.database, self) # rows are loaded from the database as they're displayed
+        self.results_table = QTableView() # table with brief results listed, clicking on a row shows full EO details below
+        self.results_table.setModel(self.results_model)
 
-        self.results_table.setColumnCount(3) # id, title, date
-        self.results_table.setHorizontalHeaderLabels(["ID", "Title", "Date"])
-        self.results_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.results_table.setEditTriggers(QTableView.NoEditTriggers)
         self.results_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        self.results_table.horizontalHeader().setResizeContentsPrecision(0)  # size the id column from the visible rows only, sampling more would load extra blocks
         self.results_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
         self.results_table.setWordWrap(True)
-        self.results_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        # rows start out two lines high and only the visible ones get sized to their contents, sizing every row would load them all up front
+        self.results_table.verticalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.results_table.verticalHeader().setDefaultSectionSize(self.results_table.fontMetrics().lineSpacing() * 2 + 8)
+        self.results_table.verticalScrollBar().valueChanged.connect(lambda _: self.row_resize_timer.start())
+        self.results_table.horizontalHeader().sectionResized.connect(lambda *_: self.row_resize_timer.start())
+        self.results_model.modelReset.connect(lambda: self.row_resize_timer.start())
+        self.results_model.rowsInserted.connect(lambda *_: self.row_resize_timer.start())
         self.results_table.verticalHeader().setVisible(False)
-        self.results_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.results_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.results_table.setSelectionBehavior(QTableView.SelectRows)
+        self.results_table.setSelectionMode(QTableView.SingleSelection)
         self.results_table.setItemDelegate(NoElidingDelegate())  # using custom delegate to manually disable text elision (titles would always show as "..." instead of the actual text)
-        self.results_table.cellDoubleClicked.connect(lambda row, col: self.show_details(self.results_table.item(row, 0).text()))
+        self.results_table.doubleClicked.connect(lambda index: self.show_details(self.results_model.entry_id(index.row())))
         self.results_table.setSortingEnabled(True)
-        #self.results_table.sortItems(2, Qt.DateFormat)
+        self.results_table.sortByColumn(0, Qt.AscendingOrder)
 
         self.foundation_layout.addWidget(self.results_table)
         self.populate_table()
         self.show()
 
 
-    def run_scraper(self):
-        """Launches the scraper to update the database with new executive orders"""
-        try:
-            self.scraper = Scraper()
-            self.scraper.database = self.database
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.row_resize_timer.start()  # a taller window shows rows that haven't been sized yet
 
-            scraped_eos = self.scraper.eo_data
-            self.database.raw_eo_data = scraped_eos
-
-            for eo in scraped_eos:
-                self.database.store_eo(eo)
+    def resize_visible_rows(self):
+        """Sizes the rows currently in view to fit their contents, so long titles aren't cut off"""
+        viewport_height = self.results_table.viewport().height()
+        row = self.results_table.rowAt(0)
+        if row == -1:
+            return
+        while row < self.results_model.rowCount() and self.results_table.rowViewportPosition(row) < viewport_height:
+            self.results_table.resizeRowToContents(row)
+            row += 1
 
-            QMessageBox.information(self, "Scraper Finished", 
-                f"The scraper has finished running. Added {self.database.added_eos} new executive orders to the database.")
-            self.database.added_eos = 0  # reset counter
-            self.populate_table()
+    def run_scraper(self):
+        """Launches the scraper on a background thread to update the database with new executive orders"""
+        if self.scraper_thread is not None and self.scraper_thread.is_alive():
+            return
+        self.run_scraper_button.setEnabled(False)
+        self.run_scraper_button.setText("Scraping...")
+        # daemon thread, so closing the viewer doesn't wait for a running scrape
+        self.scraper_thread = threading.Thread(target=self._scrape_in_background, daemon=True)
+        self.scraper_thread.start()
+
+    def _scrape_in_background(self):
+        """Runs the scraper with its own database connection, reporting back through queued signals"""
+        database = None
+        try:
+            database = Database()  # sqlite connections shouldn't be shared between threads
+            scraper = Scraper(database, on_batch_stored=self.scraper_signals.batchStored.emit)
+            self.scraper_signals.finished.emit(scraper.added_eos)
         except Exception as e:
-            QMessageBox.critical(self, "Scraper Error", f"An error occurred while running the scraper: {e}")
+            self.scraper_signals.failed.emit(str(e))
+        finally:
+            if database:
+                database.close()
+
+    def on_scraper_batch_stored(self):
+        """Adds newly stored EOs to the table while the scraper is still running"""
+        self.results_model.append_new_rows()
+
+    def on_scraper_finished(self, added_eos):
+        """Reports the scraper results once it's done"""
+        self._reset_scraper_button()
+        QMessageBox.information(self, "Scraper Finished", 
+            f"The scraper has finished running. Added {added_eos} new executive orders to the database.")
+        self.results_model.append_new_rows()
+
+    def on_scraper_failed(self, error):
+        """Reports an error raised by the scraper thread"""
+        self._reset_scraper_button()
+        QMessageBox.critical(self, "Scraper Error", f"An error occurred while running the scraper: {error}")
+
+    def _reset_scraper_button(self):
+        self.run_scraper_button.setEnabled(True)
+        self.run_scraper_button.setText("Run Scraper")
 
     def clear_results(self):
         """Clears the results table and repopulates it with all executive orders"""
-        self.results_table.setRowCount(0)
         self.search_input.clear()
         self.populate_table()
 
     def populate_table(self):
         """Populates the results table with all executive orders from the database"""
-        rows = self.database.full_database()
-        if not rows:
-            self.results_table.setRowCount(0)
-            return
-        
-        self.results_table.setRowCount(len(rows))
-        for row_idx, row_data in enumerate(rows):
-            entry_id = row_data[0]
-            title = row_data[1]
-            title = title.strip()
-            date = row_data[2]
-            self.results_table.setItem(row_idx, 0, QTableWidgetItem(str(entry_id)))
-            self.results_table.setItem(row_idx, 1, QTableWidgetItem(str(title)))
-            self.results_table.setItem(row_idx, 2, QTableWidgetItem(str(date)))
+        self.results_model.refresh()
 
     def show_details(self, eo_id):
         """Shows detailed information about a selected executive order"""
@@ -276,20 +565,55 @@ class Viewer(QMainWindow):
             QMessageBox.warning(self, "Not Found", f"No executive order found with ID: {eo_id}")
 
     def perform_search(self):
-        """Executes a requested search using the data within the search bar"""
-        criteria = f"%{self.search_input.text()}%"
-        cursor = self.database.con.execute(f"SELECT id, title, date FROM executive_orders WHERE id LIKE ? OR title LIKE ? OR date LIKE ? OR content LIKE ? OR url LIKE ?",
-                                           (criteria, criteria, criteria, criteria, criteria))
-        rows = cursor.fetchall()
-        self.results_table.setRowCount(len(rows))
-        for row_idx, row_data in enumerate(rows):
-            entry_id = row_data[0]
-            title = row_data[1]
-            title = title.strip()
-            date = row_data[2]
-            self.results_table.setItem(row_idx, 0, QTableWidgetItem(str(entry_id)))
-            self.results_table.setItem(row_idx, 1, QTableWidgetItem(str(title)))
-            self.results_table.setItem(row_idx, 2, QTableWidgetItem(str(date)))
+        """Executes a requested search using the data within the search bar on a background thread"""
+        self.search_timer.stop()
+        self._search_seq += 1
+        criteria = self.search_input.text()
+        if not criteria.strip():
+            self.populate_table()
+            return
+
+        QThreadPool.globalInstance().start(SearchTask(self.database, criteria, self._search_seq, self.search_signals))
+
+    def show_search_results(self, seq, rows):
+        """Renders the results of a finished search, unless a newer search has been started since"""
+        if seq == self._search_seq:
+            self.results_model.set_results(rows)
+
+    def on_search_failed(self, seq, error):
+        """Reports an error raised by a search task, unless a newer search has been started since"""
+        if seq == self._search_seq:
+            self.results_model.set_results([])  # don't leave the previous results up as if they matched
+            QMessageBox.warning(self, "Search Error", f"An error occurred while searching: {error}")
+
+
+class SearchSignals(QObject):
+    """Signals used by search tasks to hand their results back to the GUI thread"""
+    resultsReady = Signal(int, list)
+    failed = Signal(int, str)  # search sequence number, error message
+
+
+class SearchTask(QRunnable):
+    """Runs a database search on a pooled thread so typing doesn't block the GUI"""
+    def __init__(self, database, criteria, seq, signals):
+        super().__init__()
+        self.database = database
+        self.criteria = criteria
+        self.seq = seq
+        self.signals = signals
+
+    def run(self):
+        try:
+            con = sqlite3.connect(self.database.db_path)  # sqlite connections shouldn't be shared between threads
+            con.row_factory = sqlite3.Row
+            try:
+                rows = self.database.search(self.criteria, con)
+            finally:
+                con.close()
+        except Exception as e:  # e.g. a locked database while the scraper is writing, reported back instead of dying with the task
+            self.signals.failed.emit(self.seq, str(e))
+            return
+        self.signals.resultsReady.emit(self.seq, rows)
 
 class DetailViewer(QDialog):
     def __init__(self, parent,eo_data):
@@ -328,19 +652,59 @@ class DetailViewer(QDialog):
 
 
 ##*-*## Scraping classes & methods ##*-*##
+# only the parts of a page that are actually read get parsed
+# a class_ string only matches the whole class attribute when straining, so the listing div is matched on its class tokens instead
+LISTING_STRAINER = SoupStrainer("div", class_=lambda classes: classes is not None and "wp-block-query" in classes.split())  # EO list and pagination
+DETAIL_STRAINER = SoupStrainer(["h1", "time", "p", "div"])  # headline, date and body paragraphs
+
+# compiled once so every listing page reuses the same matchers
+LISTING_LINKS_SELECTOR = soupsieve.compile("div.wp-block-query.is-layout-flow.wp-block-query-is-layout-flow li a[href]")
+PAGINATION_LINKS_SELECTOR = soupsieve.compile("div.wp-block-query-pagination-numbers a.page-numbers")
+
+# EO page fields are pulled out with regexes, building a soup is only the fallback
+TITLE_RE = re.compile(r'<h1[^>]*class="[^"]*wp-block-whitehouse-topper__headline[^"]*"[^>]*>(.*?)</h1>', re.S)
+DATE_RE = re.compile(r'<time[^>]*>(.*?)</time>', re.S)
+ENTRY_CONTENT_RE = re.compile(r'<div[^>]*class="(?:[^"]*\s)?entry-content(?:\s[^"]*)?"')  # whole class token only, like div.entry-content
+DIV_TAG_RE = re.compile(r'<(/?)div\b', re.I)  # used to find where the entry-content div closes
+PARAGRAPH_RE = re.compile(r'<p(?:\s[^>]*)?>(.*?)</p>', re.S)
+TAG_RE = re.compile(r'<[^>]+>')
+
+# month names as written on EO pages, used by convert_date
+MONTHS = {
+    "January": "01", "February": "02", "March": "03", "April": "04", "May": "05", "June": "06",
+    "July": "07", "August": "08", "September": "09", "October": "10", "November": "11", "December": "12"
+}
+
+# resources the listing pages don't need for link scraping
+BLOCKED_RESOURCE_TYPES = {"image", "font", "stylesheet", "media"}
+BLOCKED_URL_PATTERN = re.compile(r"analytics|gtm|google")  # tracking requests
+
 class Scraper:
-    def __init__(self):
+    STORE_BATCH_SIZE = 25 # scraped EOs are written to the database in batches of this size
+    STORE_FLUSH_SECONDS = 2 # or after this many seconds, whichever comes first
+
+    def __init__(self, database=None, on_batch_stored=None):
         self.debug = config["debug_mode"]
         self.safety_delays = config["safety_delays"]
 
         self.foundation_url = "https://www.whitehouse.gov/presidential-actions/executive-orders/"
-        self.selected_url = None 
-        self.eo_links = []
+        self.skip_urls = {self.foundation_url, "https://www.whitehouse.gov/presidential-actions/"} # listing links that aren't EOs
+        self.total_pages = 1 # updated once the first listing page is scraped
+        self.listing_tabs = config["listing_tabs"]
+        self.eo_links = set()
         self.eo_data = []
+        self.added_eos = 0 # number of scraped EOs that were new to the database
+        self.max_concurrent_requests = config["max_concurrent_requests"]
+        self.semaphore = None # created inside the event loop
+        self.http = None # http client used for fetching individual EOs
+        self.context = None # browser context, used to open extra listing tabs
+        self.queue = None # scraped EOs waiting to be stored
+        self.on_batch_stored = on_batch_stored # called after each batch is written to the database
 
-        self.database = None # placeholder for database link
+        self.database = database
+        self.known_urls = database.known_urls() if database else set() # EOs already stored are never fetched again
 
-        if self.debug:
+        if self.debug and threading.current_thread() is threading.main_thread():  # handlers can only be set from the main thread
             signal.signal(signal.SIGINT, self.signal_handler)
             signal.signal(signal.SIGTERM, self.signal_handler)
 
@@ -360,7 +724,7 @@ class Scraper:
     async def launch_scraper(self):
         """Launches a playwright browser instance for scraping"""
         async with Stealth().use_async(async_playwright()) as p:
-            context = await p.chromium.launch_persistent_context(
+            self.context = context = await p.chromium.launch_persistent_context(
                 user_data_dir = config["playwright_tmp_dir"],
                 headless=False if self.debug else True,  
                 args = [
@@ -370,7 +734,8 @@ class Scraper:
                     '--disable-web-security',
                     '--disable-features=VizDisplayCompositor',
                     '--disable-features=IsolateOrigins,site-per-process',
-                    '--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36'
+                    '--blink-settings=imagesEnabled=false',
+                    f'--user-agent={config["user_agent"]}'
                 ],
                 viewport={"width": 1280, "height": 800},
                 ignore_https_errors=True
@@ -378,10 +743,21 @@ class Scraper:
 
             page = context.pages[0]
 
-            # Block tracking requests to avoid detection
-            await page.route('**/*analytics*', lambda route: route.abort())
-            await page.route('**/*gtm*', lambda route: route.abort())
-            await page.route('**/*google*', lambda route: route.abort())
+            # Block tracking requests to avoid detection, and heavy resources to speed up loading (set on the context so every tab is covered)
+            await context.route('**/*', self.filter_request)
+
+            # EO pages are static html, so they are fetched over plain http instead of through the browser
+            self.semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+            self.http = httpx.AsyncClient(
+                headers={"User-Agent": config["user_agent"]},
+                http2=True,
+                timeout=15.0,
+                follow_redirects=True
+            )
+
+            # scraped EOs are stored while the remaining ones are still being fetched
+            self.queue = asyncio.Queue(maxsize=64)
+            store_task = asyncio.create_task(self.store_results())
 
             try:
                 await self.scrape_eo_links(page)
@@ -390,134 +766,243 @@ class Scraper:
                 import traceback
                 traceback.print_exc()
                 print("Succesfully scraped data: ", len(self.eo_data))
+            finally:
+                await self.queue.put(None)  # tells store_results that scraping is done
+                await store_task
+                if self.database is not None and self.added_eos:
+                    self.database.analyze()  # once per scrape, not per stored batch
+                await self.http.aclose()
 
             await context.close()
         
         #self.print_eo_data()
         print("Total EO links scraped: ", len(self.eo_links))
 
+    async def filter_request(self, route):
+        """
+        Aborts tracking and non-essential resource requests, lets everything else through
+        """
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_URL_PATTERN.search(request.url):
+            await route.abort()
+        else:
+            await route.continue_()
+
     async def scrape_eo_links(self, page):
         """
         Scrapes all executive order links from the white house website
         """
-        self.selected_url = self.foundation_url # select foundation url
-        current_page = 1
-        total_pages = 1 # initialize total pages to 1, will be updated after
+        # the first page is scraped on its own since it tells us how many pages there are
+        self.total_pages = await self.scrape_listing_page(page, 1)
+        remaining_pages = list(range(2, self.total_pages + 1))
+        if not remaining_pages:
+            return
 
-        while current_page <= total_pages:
-            if current_page > total_pages:
-                break
+        # the remaining page urls are predictable, so spread them over several tabs
+        tab_count = min(self.listing_tabs, len(remaining_pages))
+        tabs = [page] + [await self.context.new_page() for _ in range(tab_count - 1)]
+        shards = [remaining_pages[i::tab_count] for i in range(tab_count)]
+        await asyncio.gather(*[self._scrape_listing_shard(tab, shard) for tab, shard in zip(tabs, shards)])
 
-            if current_page > 1 and self.safety_delays:
+    async def _scrape_listing_shard(self, page, page_numbers):
+        """
+        Scrapes the given listing pages one after another on a single tab
+        """
+        for page_number in page_numbers:
+            if self.safety_delays:
                 page_delay = random.randint(2, 5)
                 await asyncio.sleep(page_delay)  # Sleep to avoid overwhelming the server
+            await self.scrape_listing_page(page, page_number)
 
-            try:
-                print(f"Scraping page {current_page} of {total_pages}...")
-                # navigate to page
-                await page.goto(self.selected_url, wait_until="domcontentloaded", timeout=10000)
+    async def scrape_listing_page(self, page, page_number):
+        """
+        Scrapes the EO links from a single listing page and pulls their data, returns the total page count listed on the page
+        """
+        url = self.foundation_url if page_number == 1 else f"{self.foundation_url}page/{page_number}/"
+        try:
+            print(f"Scraping page {page_number} of {self.total_pages}...")
+            # navigate to page
+            await page.goto(url, wait_until="commit", timeout=10000)  # wait_for_selector below decides when the page is usable
 
-                # wait for content to load
-                await page.wait_for_selector("div.wp-block-query", timeout=10000)
-                content = await page.content()
+            # wait for content to load
+            await page.wait_for_selector("div.wp-block-query", timeout=10000)
+            content = await page.content()
 
-                soup = BeautifulSoup(content, "html.parser")
+            soup = BeautifulSoup(content, "lxml", parse_only=LISTING_STRAINER)
+        except Exception as e:
+            print(f"An error occurred while scraping page {page_number}: {e}")
+            return 1
+
+        # read total pages
+        total_pages = 1
+        page_number_links = PAGINATION_LINKS_SELECTOR.select(soup)
+        if page_number_links:
+            total_pages = int(page_number_links[-1].text)
+
+        # no awaits happen while collecting links, so tabs can't interleave on self.eo_links
+        found_links = []
+        for link in LISTING_LINKS_SELECTOR.select(soup):  # links within the div containing the list of executive orders
+            href = link.get("href")
+            if href in self.skip_urls:
+                continue # skip the foundation url and general presidential actions url
+            if href in self.eo_links or href in self.known_urls:
+                continue # skip duplicates and EOs that are already stored
+            found_links.append(href)
+            self.eo_links.add(href)
+
+        del soup, content  # not needed anymore, free them instead of holding them through the EO fetches below
+
+        # process individual EO links concurrently to pull and populate data
+        print(f"Processing {len(found_links)} EOs on page {page_number}...")
+        await asyncio.gather(*[self._bounded_get(url) for url in found_links], return_exceptions=True)  # one failed EO shouldn't cancel the rest
+        return total_pages
+
+    async def _bounded_get(self, url):
+        """
+        Scrapes the given EO url, limited by the semaphore
+        """
+        async with self.semaphore:
+            try:
+                eo = await self.get_eo_data(url)
+                await self.queue.put(eo)
             except Exception as e:
-                print(f"An error occurred while scraping page {current_page}: {e}")
-                current_page += 1
-                continue
-
-            # assign total pages
-            if current_page == 1:
-                pagination_div = soup.find("div", class_="wp-block-query-pagination-numbers")
-                if pagination_div:
-                    final_page = pagination_div.find_all("a", "page-numbers")[-1]
-                    total_pages = int(final_page.text)
-                    
-            found_links = []
-            for div in soup.find_all("div", "wp-block-query is-layout-flow wp-block-query-is-layout-flow"):  # find the div containing the list of executive orders
-                for item in div.find_all("li"):
-                    potential_links = [a for a in item.find_all("a") if a.get("href")]
-                    for link in potential_links:
-                        if link.get("href") == self.foundation_url or link.get("href") == "https://www.whitehouse.gov/presidential-actions/":
-                            continue # skip the foundation url and general presidential actions url
-                        if link.get("href") in self.eo_links:
-                            continue # skip duplicates
-                        link = link.get("href")
-                        found_links.append(link)
-                        self.eo_links.append(link)
-
-            soup.decompose()  
-
-            # process individual EO links to pull and populate data
-            for i, url in enumerate(found_links, 1):
-                try:
-                    print(f"Processing EO {i} on page {current_page}: {url}")
-                    await self.get_eo_data(page, url)
-                except Exception as e:
-                    print(f"An error occurred while processing EO {i} on page {current_page}: {e}")
-                    continue
-
-            # move to the next page
-            current_page += 1
-            self.selected_url = f"{self.foundation_url}page/{current_page}/"
-
-
-    async def get_eo_data(self, page, url):
+                print(f"An error occurred while processing EO {url}: {e}")
+
+    async def store_results(self):
+        """
+        Drains scraped EOs from the queue into the database in batches, until a None is received
+        """
+        loop = asyncio.get_running_loop()
+        batch = []
+        last_flush = loop.time()
+        done = False
+        while not done:
+            try:
+                eo = await asyncio.wait_for(self.queue.get(), timeout=self.STORE_FLUSH_SECONDS)
+                if eo is None:
+                    done = True
+                else:
+                    batch.append(eo)
+            except asyncio.TimeoutError:
+                pass  # nothing new, but a partial batch may be due for a flush
+
+            if batch and (done or len(batch) >= self.STORE_BATCH_SIZE or loop.time() - last_flush >= self.STORE_FLUSH_SECONDS):
+                self.store_batch(batch)
+                batch = []
+                last_flush = loop.time()
+
+    def store_batch(self, batch):
         """
-        Scrapes the executive order data from a given url
+        Writes a batch of scraped EOs to the database and notifies the listener
         """
+        if self.database is None:
+            return
         try:
-            if self.safety_delays:
-                await asyncio.sleep(1)
+            self.added_eos += self.database.store_many(batch)
+        except Exception as e:
+            print(f"An error occurred while storing {len(batch)} EOs: {e}")
+            return
+        if self.on_batch_stored:
+            self.on_batch_stored()
 
-            # navigate to EO page
-            await page.goto(url, wait_until="domcontentloaded", timeout=10000)
+    async def get_eo_data(self, url):
+        """
+        Scrapes the executive order data from a given url, returns the scraped entry
+        """
+        try:
+            if self.safety_delays:
+                await asyncio.sleep(random.uniform(0.3, 0.8))  # short and jittered, since this holds a concurrency slot
 
-            # wait for content to load
-            await page.wait_for_selector("h1.wp-block-whitehouse-topper__headline", timeout=10000)
-            
-            # get content and create soup
-            content = await page.content()
-            soup = BeautifulSoup(content, "html.parser")
+            # fetch EO page
+            resp = await self.http.get(url)
+            resp.raise_for_status()
 
-            title = soup.find("h1", class_="wp-block-whitehouse-topper__headline").text
-            raw_date = soup.find("time").text
+            title, raw_date, content = self.parse_eo_page(resp.text)
             date = self.convert_date(raw_date)
-            raw_content = [p.text for p in soup.find_all("p")]
-            content = "\n".join(raw_content)
 
-            soup.decompose()  
             print(f"Scraped data for {url}: Title: {title}, Date: {date}")  
             
-            self.eo_data.append({
+            eo = {
                 "id": None,
                 "title": title,
                 "date": date,
                 "content": content,
                 "url": url
-            })
+            }
 
         except Exception as e:
             print(f"An error occurred while scraping data for {url}: {e}")
-            self.eo_data.append({
+            eo = {
                 "id": None,
                 "title": "N/A",
                 "date": "N/A",
                 "content": "N/A",
                 "url": url
-            })
+            }
+
+        self.eo_data.append(eo)
+        return eo
+
+    def parse_eo_page(self, page_html):
+        """
+        Extracts the title, raw date and content from an EO page's html
+        """
+        title_match = TITLE_RE.search(page_html)
+        date_match = DATE_RE.search(page_html)
+        if title_match is None or date_match is None:
+            return self.parse_eo_page_soup(page_html)  # unexpected markup, let BeautifulSoup deal with it
+
+        # only search the EO body when it can be found, up to where its div closes
+        start, end = 0, len(page_html)
+        body_match = ENTRY_CONTENT_RE.search(page_html)
+        if body_match:
+            start = body_match.end()
+            depth = 1
+            for tag in DIV_TAG_RE.finditer(page_html, start):
+                depth += -1 if tag.group(1) else 1
+                if depth == 0:
+                    end = tag.start()
+                    break
+
+        title = self.strip_tags(title_match.group(1))
+        raw_date = self.strip_tags(date_match.group(1))
+        content = "\n".join(self.strip_tags(p) for p in PARAGRAPH_RE.findall(page_html, start, end))
+
+        if self.debug:
+            # both extraction paths should agree, flag pages where the regexes drift from BeautifulSoup
+            soup_content = self.parse_eo_page_soup(page_html)[2]
+            if soup_content != content:
+                print(f"Regex and BeautifulSoup extraction disagree on EO content for '{title}'")
+        return title, raw_date, content
+
+    def parse_eo_page_soup(self, page_html):
+        """
+        Extracts the title, raw date and content from an EO page's html using BeautifulSoup
+        """
+        soup = BeautifulSoup(page_html, "lxml", parse_only=DETAIL_STRAINER)
+        title = soup.find("h1", class_="wp-block-whitehouse-topper__headline").text
+        raw_date = soup.find("time").text
+        body = soup.select_one("div.entry-content") or soup  # only search the EO body when it can be found
+        content = "\n".join(p.get_text().strip() for p in body.find_all("p"))
+        return title, raw_date, content
+
+    def strip_tags(self, fragment):
+        """
+        Turns an html fragment into plain text
+        """
+        return html.unescape(TAG_RE.sub("", fragment)).strip()
 
     def convert_date(self, raw_date):
         """
         Converts a raw date string into YYYY-MM-DD format
         """
         try:
-            raw_date.strip()
-            date_obj = datetime.datetime.strptime(raw_date, "%B %d, %Y")
-            formatted_date = date_obj.strftime("%Y-%m-%d")
-            return formatted_date
-        except ValueError:
+            month, day, year = raw_date.strip().replace(",", "").split()  # e.g. "January 20, 2025"
+            day = int(day)
+            if len(year) != 4 or not year.isdigit() or not 1 <= day <= calendar.monthrange(int(year), int(MONTHS[month]))[1]:
+                return raw_date  # impossible dates are returned as-is, like strptime used to reject them
+            return f"{year}-{MONTHS[month]}-{day:02d}"
+        except (KeyError, ValueError):
             return raw_date  # return as-is if parsing fails
 
     def print_eo_data(self):
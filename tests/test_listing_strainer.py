@@ -0,0 +1,52 @@
+"""
+Regression test for the listing page strainer, making sure the strained soup still holds the EO links and the pagination
+"""
+import unittest
+
+from bs4 import BeautifulSoup
+
+from EO_parser import LISTING_LINKS_SELECTOR, LISTING_STRAINER, PAGINATION_LINKS_SELECTOR
+
+
+# trimmed down copy of the markup on whitehouse.gov/presidential-actions/executive-orders/
+LISTING_PAGE = """
+<html><body>
+<header><nav><a href="https://www.whitehouse.gov/">Home</a></nav></header>
+<main>
+<div class="wp-block-query is-layout-flow wp-block-query-is-layout-flow">
+  <ul class="wp-block-post-template is-layout-flow wp-block-post-template-is-layout-flow">
+    <li class="wp-block-post"><h2 class="wp-block-post-title"><a href="https://www.whitehouse.gov/presidential-actions/2025/02/adjusting-imports-of-steel/">Adjusting Imports of Steel</a></h2></li>
+    <li class="wp-block-post"><h2 class="wp-block-post-title"><a href="https://www.whitehouse.gov/presidential-actions/2025/02/adjusting-imports-of-aluminum/">Adjusting Imports of Aluminum</a></h2></li>
+  </ul>
+  <nav class="wp-block-query-pagination is-layout-flex wp-block-query-pagination-is-layout-flex">
+    <div class="wp-block-query-pagination-numbers">
+      <span aria-current="page" class="page-numbers current">1</span>
+      <a class="page-numbers" href="https://www.whitehouse.gov/presidential-actions/executive-orders/page/2/">2</a>
+      <a class="page-numbers" href="https://www.whitehouse.gov/presidential-actions/executive-orders/page/14/">14</a>
+    </div>
+  </nav>
+</div>
+</main>
+<footer><a href="https://www.whitehouse.gov/privacy/">Privacy</a></footer>
+</body></html>
+"""
+
+
+class ListingStrainerTest(unittest.TestCase):
+    def setUp(self):
+        self.soup = BeautifulSoup(LISTING_PAGE, "lxml", parse_only=LISTING_STRAINER)
+
+    def test_keeps_eo_links(self):
+        links = [link["href"] for link in LISTING_LINKS_SELECTOR.select(self.soup)]
+        self.assertEqual(links, [
+            "https://www.whitehouse.gov/presidential-actions/2025/02/adjusting-imports-of-steel/",
+            "https://www.whitehouse.gov/presidential-actions/2025/02/adjusting-imports-of-aluminum/",
+        ])
+
+    def test_keeps_pagination(self):
+        page_numbers = [link.text for link in PAGINATION_LINKS_SELECTOR.select(self.soup)]
+        self.assertEqual(page_numbers, ["2", "14"])
+
+
+if __name__ == "__main__":
+    unittest.main()